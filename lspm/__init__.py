@@ -6,8 +6,20 @@
 
 # ---------------------------------------- IMPORTS ----------------------------------------
 
-from .laptop_smart_power_manager import LaptopSmartPowerManager
-from .smartplug import PlugCredentials, SmartPlug, TapoPlug
+# Public names are imported lazily (PEP 562) so that lightweight usages
+# of the package do not pay for the networking and keyring stacks.
+__all__ = ["LaptopSmartPowerManager", "PlugCredentials", "SmartPlug", "TapoPlug"]
+
+
+def __getattr__(name: str):
+    if name == "LaptopSmartPowerManager":
+        from .laptop_smart_power_manager import LaptopSmartPowerManager
+        return LaptopSmartPowerManager
+    if name in ("PlugCredentials", "SmartPlug", "TapoPlug"):
+        from . import smartplug
+        return getattr(smartplug, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ---------------------------------------- VERSION ----------------------------------------
 
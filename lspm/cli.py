@@ -9,18 +9,27 @@ Command Line Interface (CLI) of the Laptop Smart Power Manager (LSPM)
 
 # ---------------------------------------- IMPORTS ----------------------------------------
 
-import re
 import sys
-import json
 import argparse
-import warnings
 
-from time import sleep
+from typing import Optional
+from ipaddress import IPv4Address
 from pathlib import Path
-from shutil import rmtree
 
-from lspm import LaptopSmartPowerManager, PlugCredentials, TapoPlug
-from lspm.exceptions import CredentialsError
+# Heavier modules (json, warnings, the lspm package itself) are imported
+# inside the functions that need them, to keep the CLI startup fast.
+
+
+# --------------------------------------- CONSTANTS ---------------------------------------
+
+# Smart Plug configuration file location, resolved once at import time.
+_LSPM_CONFIG_DIR = Path(Path.home(), '.lspm')
+_SMART_PLUG_CONFIG = Path(_LSPM_CONFIG_DIR, 'smart_plug')
+
+# Cached content of the Smart Plug configuration file, invalidated
+# whenever the file modification time changes.
+_config_cache: Optional[dict] = None
+_config_mtime: Optional[int] = None
 
 
 # ---------------------------------------- METHODS ----------------------------------------
@@ -44,7 +53,8 @@ def lspm_command() -> None:
 
     config_info = "Launch the Smart Plug configuration interface."
     config_parser = subparsers.add_parser("config", help=config_info, description=config_info)
-    config_parser.add_argument("-a", "--address", help="Set or update the Smart Plug IP address.")
+    config_parser.add_argument("-a", "--address", type=_ipv4_type,
+                               help="Set or update the Smart Plug IP address.")
     config_parser.add_argument("-u", "--username", help="Set or update the username associated to the Smart Plug.")
     config_parser.add_argument("-p", "--password", help="Set or update the password associated to the Smart Plug.")
     config_parser.add_argument("-c", "--clear", help="Clear the Smart Plug configuration.", action="store_true",
@@ -56,61 +66,110 @@ def lspm_command() -> None:
     compile_parser.set_defaults(action=_compile)
 
     args = global_parser.parse_args(args=None if sys.argv[1:] else ['-h'])
-    if args.action.__name__ in ['_start', '_compile']:
-        args.action()
-    else:
-        args.action(args)
+    args.action(args)
+
+
+def _ipv4_type(string: str) -> str:
+    """
+    Argparse type validating that an argument is a well-formed IPv4 address.
+    Invalid input is rejected by argparse before any keyring or filesystem work runs.
+
+    :param str string: command-line value to validate.
+
+    :return: The validated address, unchanged.
+    """
+    if not __is_ip_address(string):
+        raise argparse.ArgumentTypeError(f"invalid IPv4 address: {string!r}")
+    return string
 
 
 def __is_ip_address(string: str) -> bool:
-    ipv4_address_pattern = r"^(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\." \
-                           r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\." \
-                           r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\." \
-                           r"(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$"
-    string = string if isinstance(string, str) else ""
-    return True if re.match(ipv4_address_pattern, string) else False
+    if not isinstance(string, str):
+        return False
+    try:
+        IPv4Address(string)
+    except (ValueError, TypeError):
+        return False
+    return True
 
 
-def __get_smart_plug_config_data() -> dict:
+def __read_smart_plug_config_file() -> dict:
+    """
+    Reads the content of the 'smart_plug' configuration file located at $HOME$/.lspm/
+    A missing file is equivalent to an empty one; only the '.lspm' directory
+    is created when it does not exist yet.
+
+    The parsed content is cached at module level and reused as long as
+    the modification time of the file does not change.
+
+    :return: Dictionary containing the raw data stored in the configuration file.
+    """
+    import json
+
+    global _config_cache, _config_mtime
+    # Get Smart Plug config file data, assuming on the happy path
+    # that the file already exists
+    try:
+        mtime = _SMART_PLUG_CONFIG.stat().st_mtime_ns
+        # Return the cached data if the file has not changed since the last read
+        if _config_cache is not None and mtime == _config_mtime:
+            return _config_cache
+        with open(_SMART_PLUG_CONFIG, 'r') as f:
+            try:
+                config_data = json.load(f)
+            except json.JSONDecodeError:
+                config_data = dict()
+    except FileNotFoundError:
+        _LSPM_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        return dict()
+    _config_cache, _config_mtime = config_data, mtime
+    return config_data
+
+
+def __get_smart_plug_config_data(account: Optional['PlugCredentials'] = None) -> dict:
     """
     Retrieves the configuration parameters of the Connected Socket.
 
     Some of these settings are saved in the 'smart_plug' file located at $HOME$/.lspm/
-    If this file and/or the '.lspm' directory do not exist, they are then created.
+    A missing file is treated as an empty configuration; only the '.lspm' directory
+    is created when it does not exist yet (the file itself is written by
+    the 'lspm config' command).
+
+    :param Optional[PlugCredentials] account: credentials object to reuse. If not provided,
+           a new one is created, which may trigger a keyring access.
 
     :return: Dictionary containing only Smart Plug parameters available
              and correctly stored on the current machine.
     """
-    # Create Smart Plug config file if it doesn't exist
-    lspm_config_dir = Path(Path.home(), '.lspm')
-    smart_plug_config = Path(lspm_config_dir, 'smart_plug')
-    if not lspm_config_dir.exists():
-        lspm_config_dir.mkdir()
-    if not smart_plug_config.exists():
-        smart_plug_config.touch()
-    # Get Smart Plug config file data
-    with open(smart_plug_config, 'r') as f:
-        try:
-            config_data = json.load(f)
-        except json.JSONDecodeError:
-            config_data = dict()
-    # Set Smart Plug config parameters
-    config_params = dict()
-    config_params["address"] = config_data.get("address") if __is_ip_address(config_data.get("address")) else None
-    warnings.simplefilter('ignore')
-    account = PlugCredentials()
-    config_params["username"] = account.username
-    config_params["password"] = account.password
-    warnings.resetwarnings()
-    return {param: value for param, value in config_params.items() if value is not None}
+    import warnings
 
+    from lspm import PlugCredentials
 
-def _start() -> None:
+    config_data = __read_smart_plug_config_file()
+    # Set Smart Plug config parameters
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        if account is None:
+            account = PlugCredentials()
+        username, password = account.snapshot()
+        config_params = (
+            ("address", config_data.get("address") if __is_ip_address(config_data.get("address")) else None),
+            ("username", username),
+            ("password", password),
+        )
+    return {param: value for param, value in config_params if value is not None}
+
+
+def _start(args: argparse.Namespace) -> None:
     """
     Starts the Laptop Smart Power Manager.
 
+    :param argparse.Namespace args: object holding attributes entered by the user (unused).
+
     :return: None
     """
+    from lspm import LaptopSmartPowerManager, PlugCredentials, TapoPlug
+
     config = __get_smart_plug_config_data()
     missing_config_data = False
     if not config.get("address"):
@@ -138,9 +197,8 @@ def _start() -> None:
     laptop_smart_power_manager.start()
     print("Laptop Smart Power Manager started correctly")
     print("To stop it, press CTRL + C (on macOS, Command + .)")
-    # This loop stops as soon as an interrupt-related event (CTRL+C, system shutdown) appears
-    while laptop_smart_power_manager.is_running:
-        sleep(.1)
+    # This wait ends as soon as an interrupt-related event (CTRL+C, system shutdown) appears
+    laptop_smart_power_manager.wait_until_stopped()
     # Wait until the Laptop Smart Power Manager terminates
     laptop_smart_power_manager.join()
     # If the Laptop Smart Power Manager thread raised an exception, raise it here in the main thread
@@ -161,9 +219,16 @@ def _configure_smart_plug(args: argparse.Namespace) -> None:
 
     :return: None
     """
+    import os
+    import json
+    import warnings
+
+    from lspm import PlugCredentials
+    from lspm.exceptions import CredentialsError
+
     account = PlugCredentials()
     address, username, password = args.address, args.username, args.password
-    config = __get_smart_plug_config_data()
+    config = __get_smart_plug_config_data(account)
     if all(arg is None for arg in [args.address, args.username, args.password, args.clear]):
         try:
             if any(stored_info is not None for stored_info in
@@ -189,43 +254,44 @@ def _configure_smart_plug(args: argparse.Namespace) -> None:
         except KeyboardInterrupt:
             print("\nOperation aborted.")
     elif args.clear:
-        lspm_config_dir = Path(Path.home(), '.lspm')
-        rmtree(lspm_config_dir)
-        try:
+        from shutil import rmtree
+        rmtree(_LSPM_CONFIG_DIR)
+        with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            del account.password
-            del account.username
-        except CredentialsError:
-            pass
+            try:
+                del account.password
+                del account.username
+            except CredentialsError:
+                pass
         print("Smart Plug configuration cleared.")
         return
     # Set Smart Plug configuration parameters
+    # (the address is already validated, either by argparse or by the prompt loop above)
     if address is not None:
-        if not __is_ip_address(address):
-            print("Invalid IPv4 address, operation aborted.")
-            return
-        smart_plug_config = Path(Path.home(), '.lspm', 'smart_plug')
-        with open(smart_plug_config, 'r+') as f:
-            try:
-                config_data = json.load(f)
-            except json.JSONDecodeError:
-                config_data = dict()
-            config_data.update(address=address)
-            f.seek(0)
-            json.dump(config_data, f)
-            f.truncate()
-    warnings.simplefilter('ignore')
-    if username is not None:
-        account.username = username
-    if password is not None:
-        account.password = password
-    warnings.resetwarnings()
-
-
-def _compile() -> None:
+        global _config_cache
+        config_data = dict(__read_smart_plug_config_file())
+        config_data["address"] = address
+        # Write the updated configuration atomically so that
+        # a crash cannot leave a torn file behind
+        tmp_config = _SMART_PLUG_CONFIG.with_suffix('.tmp')
+        tmp_config.write_text(json.dumps(config_data, separators=(',', ':')))
+        os.replace(tmp_config, _SMART_PLUG_CONFIG)
+        # Force a reload on the next configuration read
+        _config_cache = None
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        if username is not None:
+            account.username = username
+        if password is not None:
+            account.password = password
+
+
+def _compile(args: argparse.Namespace) -> None:
     """
     Generates an executable of the Laptop Smart Power Manager.
 
+    :param argparse.Namespace args: object holding attributes entered by the user (unused).
+
     :return: None
     """
     print("Work in progress...")  # TODO
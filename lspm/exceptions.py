@@ -7,6 +7,10 @@ Exceptions
 This module includes a set of classes to handle exceptions specific to the ``lspm`` package.
 """
 
+# ---------------------------------------- IMPORTS ----------------------------------------
+
+from types import MappingProxyType
+
 
 # ---------------------------------------- CLASSES ----------------------------------------
 
@@ -16,11 +20,21 @@ class LSPMException(Exception):
     specific to the ``lspm`` package.
     """
 
-    def __init__(self) -> None:
-        self.error_msg = "LaptopSmartPowerManager Exception"
+    __slots__ = ()
+
+    def __init__(self, *args) -> None:
+        if not args:
+            args = ("LaptopSmartPowerManager Exception",)
+        super().__init__(*args)
 
-    def __str__(self) -> str:
-        return self.error_msg
+    @property
+    def error_msg(self) -> str:
+        """
+        Returns the message associated to the exception.
+
+        :return: Error message.
+        """
+        return self.args[0] if self.args else ""
 
 
 class CredentialsError(LSPMException):
@@ -29,14 +43,16 @@ class CredentialsError(LSPMException):
     the credentials associated to the Smart Plug.
     """
 
-    error_types = {
+    __slots__ = ()
+
+    error_types = MappingProxyType({
         "no_username": "No username to delete",
         "no_password": "No password to delete",
         "password_set_prematurely": "The username must be set before the password"
-    }
+    })
 
     def __init__(self, error_type: str) -> None:
-        self.error_msg = self.error_types.get(error_type)
+        super().__init__(self.error_types.get(error_type))
 
 
 class SmartPlugConnectionError(LSPMException):
@@ -44,8 +60,10 @@ class SmartPlugConnectionError(LSPMException):
     The :class:`SmartPlugConnectionError` is raised when the Smart Plug is not reachable.
     """
 
+    __slots__ = ()
+
     def __init__(self, error_msg: str) -> None:
-        self.error_msg = error_msg
+        super().__init__(error_msg)
 
 
 class SmartPlugInteractionError(LSPMException):
@@ -54,8 +72,26 @@ class SmartPlugInteractionError(LSPMException):
     the Smart Plug has been lost.
     """
 
+    __slots__ = ()
+
+    _TEMPLATE = "Unable to turn %s the Smart Plug"
+
     def __init__(self, action: str) -> None:
-        self.error_msg = f"Unable to turn {action} the Smart Plug"
+        super().__init__(self._TEMPLATE % action)
+
+
+class UnsupportedSmartPlugModel(LSPMException):
+    """
+    The :class:`UnsupportedSmartPlugModel` is raised when no SmartPlug implementation
+    supports the requested Smart Plug model.
+    """
+
+    __slots__ = ()
+
+    _TEMPLATE = "'%s' is not a supported Smart Plug model. Supported models: %s"
+
+    def __init__(self, model: str, model_names: tuple) -> None:
+        super().__init__(self._TEMPLATE % (model, ", ".join(model_names)))
 
 
 class PowerSupplyStatusCheckError(LSPMException):
@@ -64,13 +100,15 @@ class PowerSupplyStatusCheckError(LSPMException):
     the retrieval of information about the power supply status of the computer.
     """
 
-    error_types = {
+    __slots__ = ()
+
+    error_types = MappingProxyType({
         "ac_power_cable": "Unable to know if the AC power cable is connected",
         "battery_state": "Unable to get information about battery state"
-    }
+    })
 
     def __init__(self, error_type: str) -> None:
-        self.error_msg = self.error_types.get(error_type)
+        super().__init__(self.error_types.get(error_type))
 
 
 class UnsupportedSystemError(LSPMException):
@@ -79,6 +117,9 @@ class UnsupportedSystemError(LSPMException):
     a system other than Windows, Linux or macOS.
     """
 
+    __slots__ = ()
+
+    _TEMPLATE = "'%s' system is not supported. Only Windows, Linux, and macOS are currently supported"
+
     def __init__(self, system_name: str) -> None:
-        self.error_msg = f"'{system_name}' system is not supported. " \
-                         f"Only Windows, Linux, and macOS are currently supported"
+        super().__init__(self._TEMPLATE % system_name)
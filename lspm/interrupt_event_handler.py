@@ -11,14 +11,15 @@ the interruption of the Laptop Smart Power Manager.
 # ---------------------------------------- IMPORTS ----------------------------------------
 
 import platform
+import weakref
 
 from abc import ABC, abstractmethod
 from typing import Callable, Any
 from signal import signal, SIGINT, SIGTERM
+from time import monotonic
 
-from win32api import GetModuleHandle
-from win32gui import WNDCLASS, RegisterClass, CreateWindowEx, PumpWaitingMessages
-from win32con import WM_QUERYENDSESSION, WS_EX_LEFT, CW_USEDEFAULT
+# The win32 modules are imported inside WindowsInterruptEventHandler, so that
+# POSIX systems neither require pywin32 nor pay for loading it
 
 from lspm.exceptions import UnsupportedSystemError
 
@@ -41,10 +42,8 @@ def set_interrupt_event_handler(exit_function: Callable, args: Any = None,
     system_name = platform.system()
     if system_name == "Windows":
         return WindowsInterruptEventHandler(exit_function, args, kwargs)
-    elif system_name == "Linux":
-        return LinuxInterruptEventHandler(exit_function, args, kwargs)
-    elif system_name == "Darwin":
-        return MacOSInterruptEventHandler(exit_function, args, kwargs)
+    elif system_name in ("Linux", "Darwin"):
+        return PosixInterruptEventHandler(exit_function, args, kwargs)
     else:
         raise UnsupportedSystemError(system_name)
 
@@ -61,6 +60,10 @@ class InterruptEventHandler(ABC):
     :param Any kwargs: keyword arguments of ``exit_function``.
     """
 
+    # Whether callers must invoke check_events periodically for events
+    # to be dispatched (only true for the Windows message queue)
+    needs_event_pump = False
+
     def __init__(self, exit_function: Callable, args: Any = None, kwargs: Any = None) -> None:
         self._exit_function = exit_function
         self._args = args if args is not None else []
@@ -72,6 +75,24 @@ class InterruptEventHandler(ABC):
     PROTECTED METHODS
     """
 
+    def _make_exit_handler(self) -> Callable:
+        """
+        Builds a signal-handler closure holding only a weak reference to this handler.
+        The signal module keeps a strong reference to whatever is registered, so a
+        closure capturing ``self`` directly would keep the handler — and the
+        LaptopSmartPowerManager behind it — alive for the rest of the process.
+
+        :return: Callable suitable for registration with ``signal.signal``.
+        """
+        ref = weakref.ref(self)
+
+        def exit_handler(signum, frame):
+            handler = ref()
+            if handler is not None:
+                handler._exit_function(*handler._args, **handler._kwargs)
+
+        return exit_handler
+
     def _set_keyboard_interrupt_event_handler(self) -> None:
         """
         Sets the handler to catch the "keyboard interrupt" signal (CTRL + C).
@@ -80,7 +101,7 @@ class InterruptEventHandler(ABC):
 
         :return: None
         """
-        signal(SIGINT, lambda signum, frame: self._exit_function(*self._args, **self._kwargs))
+        signal(SIGINT, self._make_exit_handler())
 
     @abstractmethod
     def _set_shutdown_event_handler(self) -> None:
@@ -113,6 +134,11 @@ class WindowsInterruptEventHandler(InterruptEventHandler):
     leading to the interruption of the Smart Power Manager.
     """
 
+    needs_event_pump = True
+
+    # Monotonic timestamp of the last message-queue drain
+    _last_pump = 0.
+
     def _set_shutdown_event_handler(self) -> None:
         """
         Initializes a hidden *Microsoft Windows* window allowing to react to the Windows Shutdown Event.
@@ -121,6 +147,10 @@ class WindowsInterruptEventHandler(InterruptEventHandler):
 
         :return: None
         """
+        from win32api import GetModuleHandle
+        from win32gui import WNDCLASS, RegisterClass, CreateWindowEx
+        from win32con import WM_QUERYENDSESSION, WS_EX_LEFT, CW_USEDEFAULT
+
         handle_instance = GetModuleHandle(None)
         window_class = WNDCLASS()
         window_class.hInstance = handle_instance
@@ -144,44 +174,31 @@ class WindowsInterruptEventHandler(InterruptEventHandler):
 
     def check_events(self) -> None:
         """
-        Pumps all waiting events for the current thread.
-
-        :return: None
-        """
-        PumpWaitingMessages()
-
-
-class LinuxInterruptEventHandler(InterruptEventHandler):
-    """
-    TODO NOT TESTED !
-    The :class:`InterruptEventHandler` is intended to handle Linux-specific events
-    leading to the interruption of the Smart Power Manager.
-    """
-
-    def _set_shutdown_event_handler(self) -> None:
-        """
-        Sets an event handler that can react to the system shutdown event.
-        When this event is caught, the method associated with
-        the ``exit_function`` argument is run.
-
-        :return: None
-        """
-        signal(SIGTERM, lambda signum, frame: self._exit_function(*self._args, **self._kwargs))
-
-    def check_events(self) -> None:
-        """
-        This method is not needed for Linux-based systems.
+        Drains all waiting events for the current thread in a single pass.
+        Calls made less than 50 ms apart return immediately, so callers polling
+        in a tight loop do not hit the message queue on every iteration.
 
         :return: None
         """
-        pass
-
-
-class MacOSInterruptEventHandler(InterruptEventHandler):
+        now = monotonic()
+        if now - self._last_pump < .05:
+            return
+        self._last_pump = now
+        from win32gui import PeekMessage, TranslateMessage, DispatchMessage
+        from win32con import PM_REMOVE
+        while True:
+            status, message = PeekMessage(None, 0, 0, PM_REMOVE)
+            if not status:
+                break
+            TranslateMessage(message)
+            DispatchMessage(message)
+
+
+class PosixInterruptEventHandler(InterruptEventHandler):
     """
     TODO NOT TESTED !
-    The :class:`InterruptEventHandler` is intended to handle macOS-specific events
-    leading to the interruption of the Smart Power Manager.
+    The :class:`InterruptEventHandler` is intended to handle the events leading to
+    the interruption of the Smart Power Manager on POSIX (Linux and macOS) systems.
     """
 
     def _set_shutdown_event_handler(self) -> None:
@@ -192,11 +209,11 @@ class MacOSInterruptEventHandler(InterruptEventHandler):
 
         :return: None
         """
-        signal(SIGTERM, lambda signum, frame: self._exit_function(*self._args, **self._kwargs))
+        signal(SIGTERM, self._make_exit_handler())
 
     def check_events(self) -> None:
         """
-        This method is not needed for Mac OS-based systems.
+        This method is not needed for POSIX-based systems.
 
         :return: None
         """
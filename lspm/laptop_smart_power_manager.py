@@ -10,9 +10,15 @@ the computer and manage its power supply.
 
 # ---------------------------------------- IMPORTS ----------------------------------------
 
-from typing import Tuple
-from threading import Thread, Event, Timer
-from time import sleep
+import os
+import logging
+import platform
+
+from typing import Optional, Tuple
+from threading import Thread, Event, current_thread, main_thread
+from signal import signal, SIGINT, default_int_handler
+from time import monotonic
+from select import select
 
 from psutil import sensors_battery
 
@@ -20,6 +26,36 @@ from lspm.smartplug import SmartPlug
 from lspm.parameters import REFRESH_TIME, STATE_CHANGE_TIMEOUT, BATTERY_LOW, BATTERY_HIGH
 from lspm.exceptions import SmartPlugConnectionError, SmartPlugInteractionError, PowerSupplyStatusCheckError
 from lspm.interrupt_event_handler import set_interrupt_event_handler
+from lspm.logger import set_logging
+
+
+# ---------------------------------------- METHODS ----------------------------------------
+
+def _open_sysfs_battery_files() -> Optional[Tuple[int, int]]:
+    """
+    Opens the Linux sysfs files exposing the battery charge level and the AC adapter
+    state, keeping the file descriptors for the lifetime of the process. Reading them
+    directly avoids the directory scan and file reopening that a generic battery
+    query performs on every call.
+
+    :return: Pair of file descriptors (battery capacity, AC adapter state),
+             or None when the sysfs interface is not available.
+    """
+    try:
+        capacity_fd = os.open('/sys/class/power_supply/BAT0/capacity', os.O_RDONLY)
+    except OSError:
+        return None
+    for adapter in ('AC', 'AC0', 'ACAD', 'ADP1'):
+        try:
+            online_fd = os.open(f'/sys/class/power_supply/{adapter}/online', os.O_RDONLY)
+        except OSError:
+            continue
+        return capacity_fd, online_fd
+    os.close(capacity_fd)
+    return None
+
+
+_SYSFS_BATTERY_FDS = _open_sysfs_battery_files() if platform.system() == "Linux" else None
 
 
 # ----------------------------------------- CLASS -----------------------------------------
@@ -29,6 +65,10 @@ class LaptopSmartPowerManager(Thread):
     The :class:`LaptopSmartPowerManager` is intended to monitor the battery status of
     the laptop and manage its power supply.
 
+    :ivar Event stopped: event set when the monitoring thread terminates. Waiting on it
+          lets the main thread sleep until the LaptopSmartPowerManager stops, instead of
+          polling ``is_running``.
+
     :param SmartPlug smart_plug: the SmartPlug object with which the LaptopSmartPowerManager interacts.
     :param bool handle_exceptions_in_main_thread: defaults to ``False``. Set this parameter to ``True`` if
            exceptions raised in this thread are going to be handled from the main thread. In this case,
@@ -38,16 +78,34 @@ class LaptopSmartPowerManager(Thread):
 
     def __init__(self, smart_plug: SmartPlug, handle_exceptions_in_main_thread: bool = False) -> None:
         Thread.__init__(self)
+        set_logging()
+        self.__logger = logging.getLogger("lspm")
         self.exception = None
+        self.stopped = Event()
         self.__handle_exceptions_in_main_thread = handle_exceptions_in_main_thread
         self.__finished = Event()
         self.__connection_lost = False
         self.__smart_plug = smart_plug
+        self.__plug_state: Optional[bool] = None
+        self.__plug_state_timestamp = 0.
+        # The plug is switched off right below, so that is the initial desired state
+        self.__desired_state = False
+        # On POSIX systems, stop() wakes the monitoring thread through this pipe
+        if platform.system() == "Windows":
+            self.__wake_r = self.__wake_w = None
+        else:
+            self.__wake_r, self.__wake_w = os.pipe()
+            os.set_blocking(self.__wake_w, False)
         self.__check_connection_to_smart_plug()
-        self.__smart_plug.turn_off()
-        self.__check_smart_plug_state("off")
+        # The connectivity check has just read the plug state: reuse it to skip
+        # the turn-off request and its verification when the plug is already off
+        if self.__read_plug_state():
+            self.__smart_plug.turn_off()
+            self.__check_smart_plug_state(False)
         self.__manage_power_supply()
         self.__interrupt_event_handler = set_interrupt_event_handler(exit_function=self.stop)
+        self.__needs_event_pump = self.__interrupt_event_handler.needs_event_pump
+        self.__logger.info("Laptop Smart Power Manager initialized")
 
     """
     PROPERTIES
@@ -62,55 +120,99 @@ class LaptopSmartPowerManager(Thread):
 
         :return: ``True`` if the LaptopSmartPowerManager thread is alive, ``False`` otherwise.
         """
-        self.__interrupt_event_handler.check_events()
-        return True if self.is_alive() else False
+        if self.__needs_event_pump:
+            self.__interrupt_event_handler.check_events()
+        return self.is_alive()
 
     """
     PRIVATE METHODS
     """
 
+    def __wait_for_next_tick(self, timeout: float) -> None:
+        """
+        Waits up to ``timeout`` seconds, returning early if the manager is stopped.
+
+        On POSIX systems the wait blocks in select() on the wake-up pipe written by
+        ``stop``, avoiding the condition-variable lock traffic of ``Event.wait`` and
+        guaranteeing an immediate wake when a signal handler stops the manager.
+        On Windows, ``Event.wait`` is used.
+
+        :param float timeout: maximum time to wait, in seconds.
+
+        :return: None
+        """
+        if self.__wake_r is not None:
+            if not self.__finished.is_set():
+                select([self.__wake_r], [], [], timeout)
+        else:
+            self.__finished.wait(timeout)
+
+    def __read_plug_state(self, max_age: float = 1.) -> bool:
+        """
+        Reads the state of the Smart Plug, reusing the value obtained by a previous
+        read if it is younger than ``max_age`` seconds. Several checks within the
+        same tick thus share a single network round-trip to the Smart Plug.
+
+        :param float max_age: maximum age (in seconds) of a cached state before
+               a fresh read is issued.
+
+        :return: ``True`` if the Smart Plug is switched on, ``False`` otherwise.
+        """
+        if self.__plug_state is None or monotonic() - self.__plug_state_timestamp > max_age:
+            self.__plug_state = self.__smart_plug.is_on
+            self.__plug_state_timestamp = monotonic()
+        return self.__plug_state
+
     def __check_connection_to_smart_plug(self) -> None:
         """
-        Checks that the Smart Plug is still reachable.
+        Checks that the Smart Plug is reachable. Only called at startup: in the
+        steady state, any failing plug command proves the connection loss without
+        spending a dedicated round-trip on it.
 
         :raises SmartPlugConnectionError: if the connection to the Smart Plug is lost.
 
         :return: None
         """
         try:
-            _ = self.__smart_plug.is_on
+            _ = self.__read_plug_state()
         except Exception:
             self.__connection_lost = True
             self.stop()
             raise SmartPlugConnectionError("Connection lost to the Smart Plug") from None
 
-    def __check_smart_plug_state(self, state: str) -> None:
+    def __check_smart_plug_state(self, expected_on: bool) -> None:
         """
-        Checks that the state of the Smart Plug matches that indicated by ``state`` ("on" or "off").
+        Checks that the state of the Smart Plug matches that indicated by ``expected_on``.
 
         :raises SmartPlugInteractionError: if the state of the Smart Plug has not changed to
-                that indicated by ``state`` after the time expressed by
+                that indicated by ``expected_on`` after the time expressed by
                 ``STATE_CHANGE_TIMEOUT`` parameter.
 
-        :param str state: ``on`` if the Smart Plug is supposed to be on, ``off`` otherwise.
+        :param bool expected_on: ``True`` if the Smart Plug is supposed to be on,
+               ``False`` otherwise.
 
         :return: None
         """
-        def interaction_lost():
-            state_changed.set()
-            self.__connection_lost = True
-            self.stop()
-            raise SmartPlugInteractionError(state)
-
-        state_changed = Event()
-        expected_state = True if state.lower() == "on" else False
-        timeout = Timer(STATE_CHANGE_TIMEOUT, interaction_lost)
-        timeout.start()
-        while not state_changed.is_set():
-            if self.__smart_plug.is_on is expected_state:
-                state_changed.set()
-            sleep(.1)
-        timeout.cancel()
+        action = "on" if expected_on else "off"
+        # An inline deadline check replaces the Timer previously spawned here:
+        # verifying a state change no longer costs a whole thread
+        deadline = monotonic() + STATE_CHANGE_TIMEOUT
+        # Poll the Smart Plug with an exponential backoff so that the check issues
+        # a handful of queries instead of one every 100 ms until the timeout
+        backoff = .1
+        while not self.__finished.is_set():
+            if self.__read_plug_state(max_age=0.) is expected_on:
+                # Lazy formatting: the message is only built if the record is emitted
+                self.__logger.info("Smart Plug turned %s", action.upper())
+                return
+            if monotonic() >= deadline:
+                self.__connection_lost = True
+                self.stop()
+                raise SmartPlugInteractionError(action)
+            # The wait ends early if the manager is stopped
+            if self.__finished.wait(backoff):
+                break
+            backoff = min(backoff * 2, 1.)
 
     @staticmethod
     def __get_battery_state() -> Tuple[int, bool]:
@@ -120,6 +222,16 @@ class LaptopSmartPowerManager(Thread):
         :return: Battery power left as a percentage and boolean indicating if
                  the AC power cable is connected.
         """
+        # On Linux, read the state straight from the cached sysfs file descriptors
+        if _SYSFS_BATTERY_FDS is not None:
+            capacity_fd, online_fd = _SYSFS_BATTERY_FDS
+            try:
+                percent = int(os.pread(capacity_fd, 8, 0))
+                power_plugged = bool(int(os.pread(online_fd, 8, 0)))
+            except (OSError, ValueError):
+                pass
+            else:
+                return percent, power_plugged
         battery = sensors_battery()
         if battery is not None:
             if battery.power_plugged is None:
@@ -137,12 +249,29 @@ class LaptopSmartPowerManager(Thread):
         :return: None
         """
         percent, power_plugged = self.__get_battery_state()
+        self.__logger.debug("Battery level: %d%% - Power plugged: %s",
+                            percent, "Yes" if power_plugged else "No")
         if not power_plugged and percent < BATTERY_LOW:
-            self.__smart_plug.turn_on()
-            self.__check_smart_plug_state("on")
+            desired_state = True
         elif power_plugged and percent >= BATTERY_HIGH:
-            self.__smart_plug.turn_off()
-            self.__check_smart_plug_state("off")
+            desired_state = False
+        else:
+            desired_state = self.__desired_state
+        # Only transitions matter: when the plug is already in the desired state,
+        # skip the turn-on/turn-off request and its verification entirely
+        if desired_state == self.__desired_state:
+            return
+        self.__desired_state = desired_state
+        try:
+            if desired_state:
+                self.__smart_plug.turn_on()
+            else:
+                self.__smart_plug.turn_off()
+        except Exception:
+            self.__connection_lost = True
+            self.stop()
+            raise SmartPlugConnectionError("Connection lost to the Smart Plug") from None
+        self.__check_smart_plug_state(desired_state)
 
     """
     PUBLIC METHODS
@@ -155,19 +284,66 @@ class LaptopSmartPowerManager(Thread):
 
         :return: None
         """
-        while True:
-            self.__finished.wait(REFRESH_TIME)
-            if not self.__finished.is_set():
-                try:
-                    self.__check_connection_to_smart_plug()
-                    self.__manage_power_supply()
-                except Exception as e:
-                    if self.__handle_exceptions_in_main_thread:
-                        self.exception = e
-                    else:
-                        raise e
-            else:
-                break
+        try:
+            # Ticks are anchored to an absolute monotonic schedule so that the time
+            # spent managing the power supply does not delay subsequent checks
+            start_time = monotonic()
+            tick = 0
+            while True:
+                tick += 1
+                delay = max(0., start_time + tick * REFRESH_TIME - monotonic())
+                self.__wait_for_next_tick(delay)
+                if not self.__finished.is_set():
+                    try:
+                        self.__manage_power_supply()
+                    except Exception as e:
+                        if self.__handle_exceptions_in_main_thread:
+                            self.exception = e
+                        else:
+                            raise e
+                else:
+                    break
+        finally:
+            # Wake up any thread waiting for the LaptopSmartPowerManager to terminate
+            self.stopped.set()
+            # The monitoring thread no longer sleeps on the wake-up pipe:
+            # release its read end
+            if self.__wake_r is not None:
+                os.close(self.__wake_r)
+                self.__wake_r = None
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for the LaptopSmartPowerManager thread to terminate, then releases
+        the write end of the wake-up pipe, which no ``stop`` call can reach
+        anymore. Without this, every discarded LaptopSmartPowerManager would
+        leak its pipe descriptors for the rest of the process.
+
+        :param Optional[float] timeout: maximum time (in seconds) to wait for
+               the thread to terminate, as for ``Thread.join``.
+
+        :return: None
+        """
+        Thread.join(self, timeout)
+        if self.__wake_w is not None and not self.is_alive():
+            os.close(self.__wake_w)
+            self.__wake_w = None
+
+    def wait_until_stopped(self) -> None:
+        """
+        Blocks the calling thread until the LaptopSmartPowerManager stops.
+
+        On Linux and macOS the thread sleeps on the ``stopped`` event and consumes
+        no CPU. On Windows, the wait also wakes up twice a second to service queued
+        window messages, so the system shutdown event keeps being handled.
+
+        :return: None
+        """
+        if self.__needs_event_pump:
+            while not self.stopped.wait(.5):
+                self.__interrupt_event_handler.check_events()
+        else:
+            self.stopped.wait()
 
     def stop(self) -> None:
         """
@@ -178,3 +354,14 @@ class LaptopSmartPowerManager(Thread):
         if not self.__connection_lost:
             self.__smart_plug.turn_off()
         self.__finished.set()
+        if self.__wake_w is not None:
+            try:
+                os.write(self.__wake_w, b'x')
+            except OSError:
+                pass
+        # Give CTRL + C back its default behavior; this also drops the last
+        # signal-module reference to the interrupt handler closure
+        # (signal() is only allowed from the main thread)
+        if current_thread() is main_thread():
+            signal(SIGINT, default_int_handler)
+        self.__logger.info("Laptop Smart Power Manager stopped")
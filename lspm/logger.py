@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+"""
+Logger
+******
+
+This module configures the logging of the Laptop Smart Power Manager.
+"""
+
+# ---------------------------------------- IMPORTS ----------------------------------------
+
+import logging
+
+from pathlib import Path
+from logging.handlers import RotatingFileHandler
+
+from lspm.parameters import LOGGING_LEVEL
+
+
+# --------------------------------------- CONSTANTS ---------------------------------------
+
+# Log file location, resolved once at import time.
+_LSPM_DIR = Path.home() / '.lspm'
+_LOG_FILE = _LSPM_DIR / 'lspm.log'
+
+
+# ---------------------------------------- METHODS ----------------------------------------
+
+def set_logging() -> None:
+    """
+    Configures the ``lspm`` logger with a rotating file handler.
+
+    The log directory, handler and formatter are set up once per process:
+    subsequent calls return immediately, so restarting the LaptopSmartPowerManager
+    in the same process neither piles up handlers on the logger (which would
+    duplicate every log write) nor repeats the filesystem checks.
+
+    :return: None
+    """
+    if getattr(set_logging, "_configured", False):
+        return
+    _LSPM_DIR.mkdir(exist_ok=True)
+    handler = RotatingFileHandler(_LOG_FILE, maxBytes=1_000_000, backupCount=1)
+    handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    logger = logging.getLogger("lspm")
+    logger.addHandler(handler)
+    logger.setLevel(LOGGING_LEVEL)
+    set_logging._configured = True
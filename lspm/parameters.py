@@ -7,6 +7,8 @@ Parameters
 This module contains the main parameters that control how the Laptop Smart Power Manager runs.
 """
 
+import logging
+
 # Time interval (in seconds) between each battery status check.
 # Defaults to 30 seconds
 REFRESH_TIME = 30
@@ -20,5 +22,10 @@ STATE_CHANGE_TIMEOUT = 10
 BATTERY_LOW = 20
 
 # Percentage value equivalent to the charged battery state.
-# Defaults to 100%
-BATTERY_HIGH = 100
+# Defaults to 80% (some laptops never report values close to 100%,
+# which would make the turn-off threshold unreachable)
+BATTERY_HIGH = 80
+
+# Logging level of the Laptop Smart Power Manager.
+# Defaults to logging.INFO
+LOGGING_LEVEL = logging.INFO
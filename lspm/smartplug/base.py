@@ -9,16 +9,68 @@ This module includes the base class dedicated to the interaction with a Smart Pl
 
 # ---------------------------------------- IMPORTS ----------------------------------------
 
-from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, FrozenSet, Optional, Tuple, Type
 
 from lspm.smartplug.credentials import PlugCredentials
-from lspm.exceptions import SmartPlugConnectionError
+from lspm.exceptions import SmartPlugConnectionError, UnsupportedSmartPlugModel
+
+
+# --------------------------------------- CONSTANTS ---------------------------------------
+
+# Registry mapping each supported Smart Plug model to its implementation,
+# populated at class-definition time through SmartPlug.__init_subclass__.
+_MODELS_REGISTRY: Dict[str, Type['SmartPlug']] = {}
+
+# Sorted names of all supported Smart Plug models, maintained with the
+# registry above so the unsupported-model error path allocates nothing.
+_ALL_MODEL_NAMES: Tuple[str, ...] = ()
+
+# Entry point group under which external packages can register
+# additional SmartPlug implementations.
+_ENTRY_POINT_GROUP = "lspm.smartplug"
+
+# Whether the implementations registered through entry points
+# have been loaded already.
+_entry_points_loaded = False
+
+
+# ---------------------------------------- METHODS ----------------------------------------
+
+def _load_registered_implementations() -> bool:
+    """
+    Imports the SmartPlug implementations registered under the ``lspm.smartplug``
+    entry point group, so that external packages can provide support for
+    additional Smart Plug models without ``lspm`` knowing about them.
+    The imported classes register their models through ``__init_subclass__``.
+
+    Only implementations actually installed are loaded; there is no
+    filesystem scan involved. Requires Python 3.8 or later; on older
+    versions, only the built-in implementations are available.
+
+    :return: ``True`` if the registered implementations were loaded by this call,
+             ``False`` if they had already been loaded before.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return False
+    _entry_points_loaded = True
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        return False
+    try:
+        registered = entry_points(group=_ENTRY_POINT_GROUP)
+    except TypeError:
+        # Python < 3.10: entry_points() takes no selection arguments
+        registered = entry_points().get(_ENTRY_POINT_GROUP, ())
+    for entry_point in registered:
+        entry_point.load()
+    return True
 
 
 # ----------------------------------------- CLASS -----------------------------------------
 
-class SmartPlug(ABC):
+class SmartPlug:
     """
     The :class:`SmartPlug` abstracts out some common functionality
     that is used across all Smart Plugs.
@@ -27,83 +79,143 @@ class SmartPlug(ABC):
     :param Optional[PlugCredentials] account: credentials associated to the Smart Plug (if it has any).
     """
 
+    # Instances hold a fixed set of attributes: slots avoid the per-instance
+    # __dict__ and make attribute access a direct descriptor read
+    __slots__ = ('_address', '_account', '_plug', '_str')
+
     def __init__(self, address: str, account: Optional[PlugCredentials]) -> None:
         self._address = address
         self._account = account
-        try:
-            self._plug = self._connect()
-        except Exception:
-            raise SmartPlugConnectionError(f"Failed to connect to the Smart Plug - "
-                                           f"{self._address} is unreachable") from None
+        # The session with the Smart Plug is only established on first use,
+        # so constructing a SmartPlug does not perform any network I/O
+        self._plug: Optional[Any] = None
+        # The address never changes after construction,
+        # so the text representation can be built once here
+        self._str = f"<SmartPlug - IP Address: {address}>"
 
     def __str__(self) -> str:
-        return f"<SmartPlug - IP Address: {self._address}>"
+        return self._str
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Implementations register their models as soon as the class is
+        # defined, so resolving a model never walks the class hierarchy.
+        # Classes that do not declare any supported model themselves
+        # (e.g. intermediate bases) are skipped.
+        if 'supported_models' in cls.__dict__:
+            global _ALL_MODEL_NAMES
+            for model in cls.supported_models():
+                _MODELS_REGISTRY[model] = cls
+            _ALL_MODEL_NAMES = tuple(sorted(_MODELS_REGISTRY))
 
     """
     PROPERTIES
     """
 
     @property
-    @abstractmethod
     def name(self) -> str:
         """
         Returns the name of the Smart Plug.
 
         :return: Device name.
         """
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def information(self) -> dict:
         """
         Returns some metadata about the Smart Plug.
 
         :return: Metadata about the device.
         """
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def is_on(self) -> bool:
         """
         Returns the state of the Smart Plug.
 
         :return: ``True`` if the device is switched on, ``False`` otherwise.
         """
-        pass
+        raise NotImplementedError
 
     """
     PROTECTED METHODS
     """
 
-    @abstractmethod
+    @property
+    def _plug_obj(self) -> Any:
+        """
+        Returns the underlying object associated to the Smart Plug,
+        establishing the session on first access.
+
+        :raises SmartPlugConnectionError: if the connection to the Smart Plug fails.
+
+        :return: Underlying object associated to the Smart Plug.
+        """
+        if self._plug is None:
+            try:
+                self._plug = self._connect()
+            except Exception as exc:
+                raise SmartPlugConnectionError(f"Failed to connect to the Smart Plug - "
+                                               f"{self._address} is unreachable") from exc
+        return self._plug
+
     def _connect(self) -> Any:
         """
         Sets a session with the Smart Plug.
 
         :return: Underlying object associated to the Smart Plug.
         """
-        pass
+        raise NotImplementedError
 
     """
     PUBLIC METHODS
     """
 
-    @abstractmethod
+    @classmethod
+    def for_model(cls, model: str) -> Type['SmartPlug']:
+        """
+        Returns the SmartPlug implementation supporting the given Smart Plug model.
+
+        :raises UnsupportedSmartPlugModel: if no available implementation
+                supports the given model.
+
+        :param str model: commercial name of the Smart Plug model (e.g. ``"Tapo P100"``).
+
+        :return: SmartPlug implementation class supporting the given model.
+        """
+        implementation = _MODELS_REGISTRY.get(model)
+        if implementation is None:
+            # Give the implementations registered through entry points
+            # one chance to load, then look the model up again
+            if _load_registered_implementations():
+                implementation = _MODELS_REGISTRY.get(model)
+            if implementation is None:
+                raise UnsupportedSmartPlugModel(model, _ALL_MODEL_NAMES)
+        return implementation
+
+    @staticmethod
+    def supported_models() -> FrozenSet[str]:
+        """
+        Returns the Smart Plug models supported by this implementation.
+
+        :return: Names of the supported Smart Plug models.
+        """
+        raise NotImplementedError
+
     def turn_on(self) -> None:
         """
         Sends the turn-on request to the Smart Plug.
 
         :return: None
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def turn_off(self) -> None:
         """
         Sends the turn-off request to the Smart Plug.
 
         :return: None
         """
-        pass
+        raise NotImplementedError
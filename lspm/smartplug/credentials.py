@@ -11,7 +11,7 @@ needed to connect to the Smart Plug.
 # ---------------------------------------- IMPORTS ----------------------------------------
 
 from warnings import warn
-from typing import Optional
+from typing import Optional, Tuple
 
 from keyring import get_password, set_password, delete_password
 from keyring.errors import PasswordDeleteError
@@ -19,6 +19,13 @@ from keyring.errors import PasswordDeleteError
 from lspm.exceptions import CredentialsError
 
 
+# --------------------------------------- CONSTANTS ---------------------------------------
+
+# Sentinel marking a credential that has not been read from the keyring yet
+# (None is a valid cached value meaning "no credential stored").
+_UNSET = object()
+
+
 # ----------------------------------------- CLASS -----------------------------------------
 
 class PlugCredentials:
@@ -30,21 +37,41 @@ class PlugCredentials:
     def __init__(self) -> None:
         self.__app_id = "LaptopSmartPowerManager"
         self.__app_key = "PlugCredentials"
+        # Credentials are read from the keyring at most once per instance;
+        # setters and deleters keep these caches up to date.
+        self.__cached_username = _UNSET
+        self.__cached_password = _UNSET
 
     def __str__(self) -> str:
         return "<PlugCredentials>"
 
+    def snapshot(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Retrieves the username and password associated to the Smart Plug in a single pass.
+        Both values come from the per-instance cache, so the keyring is queried
+        at most once per credential.
+
+        :return: Tuple containing the username and the password associated
+                 with the Smart Plug (either may be None).
+        """
+        return self.username, self.password
+
     @property
     def username(self) -> Optional[str]:
         """
         Retrieves the username associated to the Smart Plug.
         Issues a warning if the username is not found.
 
+        The value read from the keyring is cached for the lifetime of the instance.
+
         :return: Username associated with the Smart Plug or None.
         """
-        username = get_password(self.__app_id, self.__app_key)
-        if username is None:
-            warn("No credentials found for the Smart Plug")
+        username = self.__cached_username
+        if username is _UNSET:
+            username = get_password(self.__app_id, self.__app_key)
+            self.__cached_username = username
+            if username is None:
+                warn("No credentials found for the Smart Plug")
         return username
 
     @username.setter
@@ -56,20 +83,28 @@ class PlugCredentials:
 
         :return: None
         """
-        old_username = get_password(self.__app_id, self.__app_key)
-        if old_username is None:
-            # Set the username
-            set_password(self.__app_id, self.__app_key, value)
+        # Reuse the cached username rather than issuing a fresh keyring read
+        old_username = self.__cached_username
+        if old_username is _UNSET:
+            old_username = get_password(self.__app_id, self.__app_key)
+        # Retrieve the password value associated to the old username
+        if self.__cached_password is not _UNSET:
+            old_password = self.__cached_password
         else:
-            # Retrieve the password value associated to the old username
-            associated_password = get_password(self.__app_id, old_username)
-            if associated_password is not None:
-                # Delete the registered password associated to the old username
-                del self.password
-                # Set the new username
-                set_password(self.__app_id, self.__app_key, value)
-                # Reassign the password value to the 'password' attribute
-                self.password = associated_password
+            old_password = get_password(self.__app_id, old_username) if old_username is not None else None
+        if old_password is not None:
+            # Delete the registered password associated to the old username
+            try:
+                delete_password(self.__app_id, old_username)
+            except PasswordDeleteError:
+                pass
+        # Set the new username
+        set_password(self.__app_id, self.__app_key, value)
+        self.__cached_username = value
+        if old_password is not None:
+            # Re-register the password value under the new username
+            set_password(self.__app_id, value, old_password)
+            self.__cached_password = old_password
 
     @username.deleter
     def username(self) -> None:
@@ -85,6 +120,7 @@ class PlugCredentials:
             delete_password(self.__app_id, self.__app_key)
         except PasswordDeleteError:
             raise CredentialsError("no_username")
+        self.__cached_username = None
 
     @property
     def password(self) -> Optional[str]:
@@ -92,12 +128,17 @@ class PlugCredentials:
         Retrieves the password associated to the Smart Plug.
         Issues a warning if the password is not found.
 
+        The value read from the keyring is cached for the lifetime of the instance.
+
         :return: Password associated with the Smart Plug or None.
         """
-        username = self.username
-        password = get_password(self.__app_id, username)
-        if username is not None and password is None:
-            warn("No password found for the Smart Plug")
+        password = self.__cached_password
+        if password is _UNSET:
+            username = self.username
+            password = get_password(self.__app_id, username) if username is not None else None
+            self.__cached_password = password
+            if username is not None and password is None:
+                warn("No password found for the Smart Plug")
         return password
 
     @password.setter
@@ -112,6 +153,7 @@ class PlugCredentials:
         if self.username is None:
             raise CredentialsError("password_set_prematurely")
         set_password(self.__app_id, self.username, value)
+        self.__cached_password = value
 
     @password.deleter
     def password(self) -> None:
@@ -125,3 +167,4 @@ class PlugCredentials:
             delete_password(self.__app_id, self.username)
         except PasswordDeleteError:
             raise CredentialsError("no_password")
+        self.__cached_password = None
@@ -9,9 +9,21 @@ This module includes the class dedicated to the interaction with TP-Link 'Tapo'
 
 # ---------------------------------------- IMPORTS ----------------------------------------
 
+from time import monotonic
+from typing import FrozenSet, Optional, Tuple
+
 from PyP100.PyP100 import P100
 
 from .base import SmartPlug
+from .credentials import PlugCredentials
+
+
+# --------------------------------------- CONSTANTS ---------------------------------------
+
+# Smart Plug models supported by the TapoPlug implementation, as a single
+# constant so that supported_models neither allocates per call
+# nor makes membership tests scan a sequence.
+_SUPPORTED_MODELS: FrozenSet[str] = frozenset({"Tapo P100", "Tapo P105", "Tapo P110"})
 
 
 # ----------------------------------------- CLASS -----------------------------------------
@@ -23,6 +35,18 @@ class TapoPlug(SmartPlug):
     with TP-Link 'Tapo' Smart Plugs.
     """
 
+    __slots__ = ('_info_cache',)
+
+    # Time (in seconds) during which the device information returned by the
+    # Smart Plug is reused instead of issuing a new request
+    _info_ttl = .5
+
+    def __init__(self, address: str, account: Optional[PlugCredentials]) -> None:
+        super().__init__(address, account)
+        # Device information from the last getDeviceInfo request,
+        # with the monotonic timestamp of its retrieval
+        self._info_cache: Optional[Tuple[float, dict]] = None
+
     """
     PROPERTIES
     """
@@ -34,16 +58,20 @@ class TapoPlug(SmartPlug):
 
         :return: Device name.
         """
-        return self._plug.getDeviceName()
+        return self._plug_obj.getDeviceName()
 
     @property
     def information(self) -> dict:
         """
         Returns some metadata about the Smart Plug.
 
+        Device information retrieved less than ``_info_ttl`` seconds ago is
+        reused, so repeated reads within that window share a single request
+        to the Smart Plug.
+
         :return: Metadata about the device.
         """
-        return self._plug.getDeviceInfo()
+        return self._get_info()
 
     @property
     def is_on(self) -> bool:
@@ -52,12 +80,26 @@ class TapoPlug(SmartPlug):
 
         :return: ``True`` if the device is switched on, ``False`` otherwise.
         """
-        return self.information['result']["device_on"]
+        return self._get_info()['result']["device_on"]
 
     """
     PROTECTED METHODS
     """
 
+    def _get_info(self) -> dict:
+        """
+        Retrieves the device information from the Smart Plug, reusing the
+        response obtained less than ``_info_ttl`` seconds ago if there is one.
+
+        :return: Metadata about the device.
+        """
+        now = monotonic()
+        if self._info_cache is not None and now - self._info_cache[0] < self._info_ttl:
+            return self._info_cache[1]
+        information = self._plug_obj.getDeviceInfo()
+        self._info_cache = (now, information)
+        return information
+
     def _connect(self) -> P100:
         """
         Sets a session with the Smart Plug.
@@ -75,13 +117,24 @@ class TapoPlug(SmartPlug):
     PUBLIC METHODS
     """
 
+    @staticmethod
+    def supported_models() -> FrozenSet[str]:
+        """
+        Returns the Smart Plug models supported by this implementation.
+
+        :return: Names of the supported Smart Plug models.
+        """
+        return _SUPPORTED_MODELS
+
     def turn_on(self) -> None:
         """
         Sends the turn-on request to the Smart Plug.
 
         :return: None
         """
-        self._plug.turnOn()
+        self._plug_obj.turnOn()
+        # The state just changed: the next information read must be fresh
+        self._info_cache = None
 
     def turn_off(self) -> None:
         """
@@ -89,4 +142,6 @@ class TapoPlug(SmartPlug):
 
         :return: None
         """
-        self._plug.turnOff()
+        self._plug_obj.turnOff()
+        # The state just changed: the next information read must be fresh
+        self._info_cache = None
@@ -7,8 +7,6 @@ Launch LSPM
 This script shows how to launch the Laptop Smart Power Manager.
 """
 
-from time import sleep
-
 from lspm import PlugCredentials, TapoPlug, LaptopSmartPowerManager
 
 
@@ -26,9 +24,8 @@ laptop_smart_power_manager = LaptopSmartPowerManager(smart_plug, handle_exceptio
 laptop_smart_power_manager.start()
 print("Laptop Smart Power Manager started correctly")
 print("To stop it, press CTRL + C (on macOS, Command + .)")
-# This loop stops as soon as an interrupt-related event (CTRL+C, system shutdown) appears
-while laptop_smart_power_manager.is_running:
-    sleep(.1)
+# This wait ends as soon as an interrupt-related event (CTRL+C, system shutdown) appears
+laptop_smart_power_manager.wait_until_stopped()
 # Wait until the Laptop Smart Power Manager terminates
 laptop_smart_power_manager.join()
 # If the Laptop Smart Power Manager thread raised an exception, raise it here in the main thread